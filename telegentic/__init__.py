@@ -1,11 +1,23 @@
 """Telegentic - Minimal Telegram Bot Framework"""
 
-# Re-export commonly used aiogram types for convenience
-from aiogram.types import BotCommand, Chat, Message, User
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
-from .admin import AdminChannelManager
-from .args import CommandArgs, EchoArgs, NoArgs
-from .bot import HandlerBotBase, HandlerProtocol, TypedEvent, no_typing
+if TYPE_CHECKING:
+    # Static checkers see the real types; at runtime the same names resolve
+    # lazily through __getattr__ below
+    from aiogram.types import BotCommand, Chat, Message, User
+
+    from telegentic.admin import AdminChannelManager
+    from telegentic.args import CommandArgs, EchoArgs, NoArgs
+    from telegentic.bot import (
+        HandlerBotBase,
+        HandlerProtocol,
+        TypedEvent,
+        no_event,
+        no_typing,
+        shared_session,
+    )
 
 __all__ = [
     "HandlerBotBase",
@@ -20,4 +32,38 @@ __all__ = [
     "Chat",
     "BotCommand",
     "no_typing",
+    "no_event",
+    "shared_session",
 ]
+
+# Exports resolve lazily (PEP 562) so `import telegentic` doesn't pay for
+# aiogram, telegramify_markdown and the bot machinery until first use
+_LAZY_ATTRS = {
+    "HandlerBotBase": ("telegentic.bot", "HandlerBotBase"),
+    "TypedEvent": ("telegentic.bot", "TypedEvent"),
+    "HandlerProtocol": ("telegentic.bot", "HandlerProtocol"),
+    "no_typing": ("telegentic.bot", "no_typing"),
+    "no_event": ("telegentic.bot", "no_event"),
+    "shared_session": ("telegentic.bot", "shared_session"),
+    "AdminChannelManager": ("telegentic.admin", "AdminChannelManager"),
+    "CommandArgs": ("telegentic.args", "CommandArgs"),
+    "EchoArgs": ("telegentic.args", "EchoArgs"),
+    "NoArgs": ("telegentic.args", "NoArgs"),
+    "Message": ("aiogram.types", "Message"),
+    "User": ("aiogram.types", "User"),
+    "Chat": ("aiogram.types", "Chat"),
+    "BotCommand": ("aiogram.types", "BotCommand"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attr_name = _LAZY_ATTRS[name]
+    value = getattr(import_module(module_name), attr_name)
+    globals()[name] = value  # Cache so subsequent lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -0,0 +1,35 @@
+"""FastAPI webhook wiring, imported lazily so polling-only bots never pay for it."""
+
+from __future__ import annotations
+
+from aiogram import Bot, Dispatcher
+from aiogram.types import Update
+from fastapi import FastAPI, Request
+
+try:
+    import orjson  # noqa: F401  # probe only; ORJSONResponse needs it at render time
+    from fastapi.responses import ORJSONResponse
+
+    _RESPONSE_CLASS: type = ORJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse
+
+    _RESPONSE_CLASS = JSONResponse
+
+
+_OK_RESPONSE = {"status": "ok"}
+
+
+def create_webhook_app(bot: Bot, dp: Dispatcher, webhook_path: str) -> FastAPI:
+    """Create a FastAPI app with the Telegram update webhook endpoint."""
+    app = FastAPI(default_response_class=_RESPONSE_CLASS)
+
+    @app.post(webhook_path)
+    async def webhook_handler(request: Request) -> dict[str, str]:
+        # Pydantic-core parses the raw JSON straight into the model,
+        # skipping the intermediate Python dict entirely
+        update = Update.model_validate_json(await request.body())
+        await dp.feed_update(bot, update)
+        return _OK_RESPONSE
+
+    return app
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
+from functools import lru_cache
 
 import telegramify_markdown  # type: ignore[import-untyped]
 from aiogram import Bot
@@ -11,34 +14,97 @@ from aiogram.exceptions import TelegramForbiddenError, TelegramNotFound
 
 logger = logging.getLogger(__name__)
 
+_ADMIN_ID_RE = re.compile(r"-?\d+")
+
+
+@lru_cache(maxsize=8)
+def _render_setup_message(
+    bot_username: str, admin_ids: tuple[int, ...], error_msg: str
+) -> str:
+    """Render the admin-setup instructions as MarkdownV2.
+
+    Built as one template instead of repeated concatenation, and memoized so
+    repeated setup failures don't re-run the markdownify conversion.
+    """
+    error_block = f"⚠️ {error_msg}\n\n" if error_msg else ""
+    admin_block = "\n".join(f"• User ID: `{admin_id}`" for admin_id in admin_ids)
+
+    markdown_content = f"""# 🔧 ADMIN CHANNEL SETUP REQUIRED
+
+{error_block}Please create an admin channel for bot notifications and monitoring:
+
+## STEP 1: Create a private channel
+• Open Telegram and create a new private channel (not a group)
+• Give it a descriptive name like 'Bot Admin Channel'
+
+## STEP 2: Add your bot as administrator
+• Add @{bot_username} to the channel
+• Make it an administrator with permissions to:
+  ✓ Invite users
+  ✓ View members
+  ✓ Post messages
+
+## STEP 3: Add admin users
+Add the following admin users to the channel:
+{admin_block}
+
+## STEP 4: Get the channel ID
+• Forward any message from the channel to @userinfobot
+• Copy the channel ID (will be negative, like `-1001234567890`)
+
+## STEP 5: Configure environment
+• Set `ADMIN_CHANNEL_ID` environment variable to the channel ID
+• Example: `ADMIN_CHANNEL_ID=-1001234567890`
+
+Once configured, restart the bot to complete setup."""
+
+    # Convert to safe MarkdownV2 format using telegramify-markdown
+    return str(telegramify_markdown.markdownify(markdown_content))
+
 
 class AdminChannelManager:
     """Manages admin channel setup and verification for telegram bots."""
 
+    __slots__ = ("bot", "_admin_ids", "_bot_username")
+
     def __init__(self, bot: Bot) -> None:
         self.bot = bot
-
-    def get_admin_ids(self) -> list[int]:
-        """Parse admin IDs from environment variable."""
-        admin_ids_str = os.getenv("ADMIN_TELEGRAM_ID", "")
-        if not admin_ids_str:
-            return []
-
+        self._admin_ids: list[int] | None = None
+        self._bot_username: str | None = None
+
+    @property
+    def admin_ids(self) -> list[int]:
+        """Admin IDs parsed once from the environment variable."""
+        if self._admin_ids is None:
+            self._admin_ids = self._parse_admin_ids()
+        return self._admin_ids
+
+    @staticmethod
+    def _parse_admin_ids() -> list[int]:
+        """Parse admin IDs from the ADMIN_TELEGRAM_ID environment variable."""
         admin_ids = []
-        # Remove any brackets and split by comma
-        clean_str = admin_ids_str.strip("[]").replace(" ", "")
-        for id_str in clean_str.split(","):
-            if id_str.strip():  # Skip empty strings
-                try:
-                    admin_ids.append(int(id_str.strip()))
-                except ValueError:
-                    logger.warning(f"Invalid admin ID format: {id_str.strip()}")
-
+        # Each comma-separated token must be a whole integer; anything else
+        # is rejected with a warning rather than mined for digit runs
+        for token in os.getenv("ADMIN_TELEGRAM_ID", "").strip("[] ").split(","):
+            token = token.strip()
+            if not token:
+                continue
+            if _ADMIN_ID_RE.fullmatch(token):
+                admin_ids.append(int(token))
+            else:
+                logger.warning(f"Invalid admin ID format: {token}")
         return admin_ids
 
+    async def _get_bot_username(self) -> str:
+        """Fetch the bot username once; it is constant for the process lifetime."""
+        if self._bot_username is None:
+            bot_info = await self.bot.get_me()
+            self._bot_username = bot_info.username or "your_bot"
+        return self._bot_username
+
     async def check_admin_channel_setup(self) -> None:
         """Check admin channel setup and notify first admin of any missing requirements."""
-        admin_ids = self.get_admin_ids()
+        admin_ids = self.admin_ids
         if not admin_ids:
             logger.info("No admin IDs configured")
             return
@@ -108,53 +174,8 @@ class AdminChannelManager:
         self, admin_id: int, admin_ids: list[int], error_msg: str = ""
     ) -> None:
         """Send admin channel setup instructions to the first admin."""
-        # Get the actual bot information to use real username
-        bot_info = await self.bot.get_me()
-        bot_username = bot_info.username or "your_bot"
-
-        # Create markdown content that will be safely converted to MarkdownV2
-        markdown_content = "# 🔧 ADMIN CHANNEL SETUP REQUIRED\n\n"
-
-        if error_msg:
-            markdown_content += f"⚠️ {error_msg}\n\n"
-
-        markdown_content += """Please create an admin channel for bot notifications and monitoring:
-
-## STEP 1: Create a private channel
-• Open Telegram and create a new private channel (not a group)
-• Give it a descriptive name like 'Bot Admin Channel'
-
-## STEP 2: Add your bot as administrator"""
-
-        # Add real bot username
-        markdown_content += f"\n• Add @{bot_username} to the channel\n"
-
-        markdown_content += """• Make it an administrator with permissions to:
-  ✓ Invite users
-  ✓ View members
-  ✓ Post messages
-
-## STEP 3: Add admin users
-Add the following admin users to the channel:
-"""
-
-        # Add admin IDs safely
-        for admin_id_item in admin_ids:
-            markdown_content += f"• User ID: `{admin_id_item}`\n"
-
-        markdown_content += """
-## STEP 4: Get the channel ID
-• Forward any message from the channel to @userinfobot
-• Copy the channel ID (will be negative, like `-1001234567890`)
-
-## STEP 5: Configure environment
-• Set `ADMIN_CHANNEL_ID` environment variable to the channel ID
-• Example: `ADMIN_CHANNEL_ID=-1001234567890`
-
-Once configured, restart the bot to complete setup."""
-
-        # Convert to safe MarkdownV2 format using telegramify-markdown
-        safe_message = telegramify_markdown.markdownify(markdown_content)
+        bot_username = await self._get_bot_username()
+        safe_message = _render_setup_message(bot_username, tuple(admin_ids), error_msg)
 
         await self.bot.send_message(
             chat_id=admin_id, text=safe_message, parse_mode="MarkdownV2"
@@ -167,16 +188,22 @@ Once configured, restart the bot to complete setup."""
         """Check if all admins are members of the admin channel."""
         missing_admins = []
 
-        for admin_id in admin_ids:
-            try:
-                member = await self.bot.get_chat_member(channel_id, admin_id)
-                if member.status in ["left", "kicked"]:
-                    missing_admins.append(admin_id)
-                else:
-                    logger.info(f"✅ Admin {admin_id} is a member of '{channel_title}'")
-            except (TelegramForbiddenError, TelegramNotFound):
+        # Fire all membership lookups concurrently instead of one RPC at a time
+        results = await asyncio.gather(
+            *(self.bot.get_chat_member(channel_id, admin_id) for admin_id in admin_ids),
+            return_exceptions=True,
+        )
+
+        for admin_id, result in zip(admin_ids, results):
+            if isinstance(result, (TelegramForbiddenError, TelegramNotFound)):
                 missing_admins.append(admin_id)
                 logger.warning(f"⚠️ Cannot check membership for admin {admin_id}")
+            elif isinstance(result, BaseException):
+                raise result
+            elif result.status in ["left", "kicked"]:
+                missing_admins.append(admin_id)
+            else:
+                logger.info(f"✅ Admin {admin_id} is a member of '{channel_title}'")
 
         if missing_admins:
             logger.warning(
@@ -10,9 +10,14 @@ T = TypeVar("T", bound=BaseModel)
 class CommandArgs(BaseModel):
     """Base class for command argument validation."""
 
+    # Forbid extra fields for strict validation; freeze instances and skip
+    # revalidation/assignment checks since parsed args are single-use
     model_config = ConfigDict(
-        extra="forbid"
-    )  # Forbid extra fields for strict validation
+        extra="forbid",
+        frozen=True,
+        revalidate_instances="never",
+        validate_assignment=False,
+    )
 
     @classmethod
     def parse_string(cls: Type[T], args_string: str) -> T:
@@ -38,21 +43,24 @@ class EchoArgs(CommandArgs):
 
     @classmethod
     def parse_string(cls, args_string: str) -> "EchoArgs":
-        """Parse echo command arguments."""
-        if not args_string.strip():
+        """Parse echo command arguments.
+
+        Parsing already guarantees field types, so instances are built with
+        `model_construct` to skip redundant Pydantic validation per call.
+        """
+        text = args_string.strip()
+        if not text:
             raise ValueError("Text is required for echo command")
 
-        # Simple parsing - text followed by optional repeat count
-        parts = args_string.strip().split()
-
-        if len(parts) == 1:
-            return cls(text=parts[0])
-        elif len(parts) >= 2 and parts[-1].isdigit():
-            repeat_count = int(parts[-1])
-            text = " ".join(parts[:-1])
-            return cls(text=text, repeat=repeat_count)
-        else:
-            return cls(text=args_string.strip())
+        # Text followed by an optional repeat count; rpartition avoids the
+        # intermediate list a split()/join round-trip would allocate
+        head, sep, tail = text.rpartition(" ")
+        if sep and tail.isdigit():
+            repeat_count = int(tail)
+            if not 1 <= repeat_count <= 10:
+                raise ValueError("Repeat count must be between 1 and 10")
+            return cls.model_construct(text=head.rstrip(), repeat=repeat_count)
+        return cls.model_construct(text=text, repeat=1)
 
 
 class NoArgs(CommandArgs):
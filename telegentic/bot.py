@@ -3,48 +3,156 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
 import logging
-import re
-from abc import ABCMeta
-from collections.abc import Awaitable, Callable
-from typing import Any, ClassVar, Protocol
+import os
+import sys
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from datetime import datetime
+from functools import partial
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, Protocol, TypeVar
 
 from aiogram import Bot, Dispatcher
-from aiogram.filters import Command
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.filters import Command, CommandObject
 from aiogram.methods import send_chat_action
-from aiogram.types import BotCommand, Message, Update
+from aiogram.types import BotCommand, Chat, Message, User
 from dotenv import load_dotenv
 
 from .admin import AdminChannelManager
 
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
 load_dotenv()
 try:
-    import uvicorn
-    from fastapi import FastAPI, Request
+    # Probe only: run_webhook passes loop="uvloop" to uvicorn, which does
+    # the policy setup itself. Polling programs opt in with uvloop.run(...)
+    # (see the README); telegentic never mutates the loop policy.
+    import uvloop  # type: ignore[import-not-found]  # noqa: F401
+
+    _UVLOOP_AVAILABLE = True
+except ImportError:
+    _UVLOOP_AVAILABLE = False
+
+try:
+    # Probe only; uvicorn imports it itself when asked for the C parser
+    import httptools  # type: ignore[import-not-found]  # noqa: F401
 
-    _FASTAPI_AVAILABLE = True
+    _HTTPTOOLS_AVAILABLE = True
 except ImportError:
-    _FASTAPI_AVAILABLE = False
+    _HTTPTOOLS_AVAILABLE = False
+
 
 logger = logging.getLogger(__name__)
 
+_HANDLE_PREFIX = "handle_"
+_CAMEL_PREFIX = "handle"
+
+
+def _camel_to_snake(tail: str) -> str:
+    """Convert a camelCase handler tail (e.g. ``FooBar``) to snake_case."""
+    # The leading capital lowercases without an underscore, so no lstrip pass
+    return tail[0].lower() + "".join(
+        "_" + c.lower() if c.isupper() else c for c in tail[1:]
+    )
+
+
+_shared_session: AiohttpSession | None = None
+
+
+def shared_session() -> AiohttpSession:
+    """Return a process-wide HTTP session for sharing across bot instances.
+
+    Each Bot otherwise owns a private aiohttp session and connection pool;
+    multi-bot deployments can pass this to every constructor to share one
+    keep-alive pool and keep file-descriptor usage flat.
+    """
+    global _shared_session
+    if _shared_session is None:
+        _shared_session = AiohttpSession()
+    return _shared_session
+
+
+def _commands_cache_path(token: str) -> Path:
+    """Cache file that remembers the last command list synced for a token."""
+    cache_dir = os.getenv("TELEGENTIC_CACHE_DIR")
+    base = Path(cache_dir) if cache_dir else Path.home() / ".cache" / "telegentic"
+    # Hash the full token: a raw prefix collides across bots sharing a bot-ID
+    # prefix and would leak secret characters into the filename
+    token_key = hashlib.blake2b(token.encode()).hexdigest()[:16]
+    return base / f"{token_key}.json"
+
+
+def _describe(method: Any) -> str:
+    """Extract a command description from the first line of a docstring."""
+    doc = getattr(method, "__doc__", None)
+    if not doc:
+        return "Command"
+    description = doc.strip().split("\n", 1)[0].strip(".")
+    return description or "Command"
+
+
+# Decorators return the handler unchanged; the bound TypeVar keeps the
+# subclass's own method type intact for static checkers
+_HandlerT = TypeVar("_HandlerT", bound=Callable[..., Awaitable[None]])
+
 
-def no_typing(func: HandlerProtocol) -> HandlerProtocol:
+def no_typing(func: _HandlerT) -> _HandlerT:
     """Decorator to disable typing indicator for a handler."""
     func._no_typing = True  # type: ignore[attr-defined]
     return func
 
 
+def no_event(func: _HandlerT) -> _HandlerT:
+    """Decorator to receive the raw aiogram Message instead of a TypedEvent.
+
+    Skips the per-message TypedEvent allocation for handlers that don't
+    need the wrapper.
+    """
+    func._skip_event = True  # type: ignore[attr-defined]
+    return func
+
+
 class TypedEvent:
-    """Typed event wrapper that provides access to aiogram Message properties."""
+    """Typed event wrapper that provides access to aiogram Message properties.
+
+    Message fields are exposed as properties rather than copied eagerly, so a
+    handler that never touches them pays only for one single-slot object.
+    Any other Message attribute is forwarded on demand.
+    """
+
+    __slots__ = ("message",)
 
     def __init__(self, msg: Message) -> None:
         self.message = msg
-        self.text = msg.text
-        self.from_user = msg.from_user
-        self.chat = msg.chat
-        self.date = msg.date
-        self.message_id = msg.message_id
+
+    def __getattr__(self, name: str) -> Any:
+        # Thin proxy: anything not defined here comes from the Message
+        return getattr(self.message, name)
+
+    @property
+    def text(self) -> str | None:
+        return self.message.text
+
+    @property
+    def from_user(self) -> User | None:
+        return self.message.from_user
+
+    @property
+    def chat(self) -> Chat:
+        return self.message.chat
+
+    @property
+    def date(self) -> datetime:
+        return self.message.date
+
+    @property
+    def message_id(self) -> int:
+        return self.message.message_id
 
     async def reply(self, text: str, **kwargs: Any) -> Message:
         """Reply to the message with type-safe parameters."""
@@ -61,162 +169,293 @@ class HandlerProtocol(Protocol):
         ...
 
 
-class HandlerMeta(ABCMeta):
-    """Metaclass that automatically discovers handler methods and creates command mappings."""
-
-    _commands: dict[str, HandlerProtocol]
-
-    def __new__(
-        mcs,
-        name: str,
-        bases: tuple[type, ...],
-        namespace: dict[str, Any],
-    ) -> type:
-        # 1) create the class
-        cls = super().__new__(mcs, name, bases, namespace)
-
-        # 2) start with any inherited commands
-        commands: dict[str, HandlerProtocol] = {}
-        for base in bases:
-            base_cmds = getattr(base, "_commands", None)
-            if isinstance(base_cmds, dict):
-                commands.update(base_cmds)
-
-        # 3) discover new handlers in this class’s namespace
-        for attr_name, method in namespace.items():
-            if not callable(method):
-                continue
-
-            cmd: str | None = None
-
-            # snake_case: handle_foo -> foo
-            if attr_name.startswith("handle_"):
-                cmd = attr_name[len("handle_") :]
-
-            # camelCase: handleFooBar -> foo_bar
-            elif attr_name.startswith("handle") and len(attr_name) > len("handle"):
-                tail = attr_name[len("handle") :]
-                if tail and tail[0].isupper():
-                    # insert underscore before each capital, lowercase everything
-                    snake = re.sub(
-                        r"([A-Z])", lambda m: "_" + str(m.group(1)).lower(), tail
-                    )
-                    cmd = snake.lstrip("_")
-
-            if cmd:
-                commands[cmd] = method  # override any inherited
-
-        # 4) attach the final map
-        cls._commands = commands
-        return cls
-
-
-class HandlerBotBase(metaclass=HandlerMeta):
+# (handler, skip_typing, event, args) awaiting execution on a chat queue
+_QueuedCommand = tuple[HandlerProtocol, bool, "TypedEvent | Message", str]
+
+
+def _discover_handlers(cls: type[HandlerBotBase]) -> None:
+    """Discover handler methods on a class and precompute its command maps."""
+    # 1) start with any inherited commands
+    commands: dict[str, HandlerProtocol] = {}
+    for base in reversed(cls.__mro__[1:]):
+        base_cmds = getattr(base, "_commands", None)
+        if base_cmds:
+            commands.update(base_cmds)
+
+    # 2) discover new handlers in this class's own namespace
+    for attr_name, method in vars(cls).items():
+        # One cheap prefix test rejects dunders and ordinary methods before
+        # the callable() call or any further string work
+        if not attr_name.startswith(_CAMEL_PREFIX):
+            continue
+        if not callable(method):
+            continue
+
+        cmd: str | None = None
+
+        # snake_case: handle_foo -> foo
+        if attr_name.startswith(_HANDLE_PREFIX):
+            cmd = attr_name[len(_HANDLE_PREFIX) :]
+
+        # camelCase: handleFooBar -> foo_bar
+        elif len(attr_name) > len(_CAMEL_PREFIX):
+            tail = attr_name[len(_CAMEL_PREFIX) :]
+            if tail[0].isupper():
+                cmd = _camel_to_snake(tail)
+
+        if cmd:
+            # Interned names hash faster in the Command filter and dict
+            commands[sys.intern(cmd)] = method  # override any inherited
+
+    # 3) attach the final map (read-only) plus a precomputed dispatch table so
+    #    the runtime path does one dict lookup instead of a getattr per
+    #    message; the table also carries the auto-help fallback. Keys are the
+    #    interned names from step 2, so every derived structure below (table,
+    #    descriptions, BotCommand list) shares the cached-hash strings.
+    cls._commands = MappingProxyType(commands)
+    cls._command_table = {
+        name: (
+            method,
+            getattr(method, "_no_typing", False),
+            getattr(method, "_skip_event", False),
+        )
+        for name, method in commands.items()
+    }
+    help_method = getattr(cls, "_auto_help_handler", None)
+    if "help" not in cls._command_table and help_method is not None:
+        cls._command_table["help"] = (help_method, False, False)
+
+    # Frozen registration order: per-instance setup iterates this tuple
+    # directly instead of walking the hash table
+    cls._commands_tuple = tuple(cls._command_table)
+
+    # 4) parse docstrings once so /help and BotFather sync never redo it
+    cls._command_descriptions = {
+        name: _describe(method) for name, method in commands.items()
+    }
+    cls._help_text = "\n".join(
+        ["Available commands:"]
+        + [
+            f"/{name} - {description}"
+            for name, description in sorted(cls._command_descriptions.items())
+        ]
+    )
+
+    # 5) build the BotFather command list once, auto-help included
+    sync_descriptions = dict(cls._command_descriptions)
+    if "help" not in sync_descriptions and help_method is not None:
+        sync_descriptions["help"] = _describe(help_method)
+    cls._bot_commands = [
+        BotCommand(command=name, description=description[:256])
+        for name, description in sync_descriptions.items()
+    ]
+
+
+class HandlerBotBase:
     """Base bot class with automatic command discovery and optional webhook support."""
 
-    _commands: ClassVar[dict[str, HandlerProtocol]]
-
-    def __init__(self, bot_token: str, webhook_path: str = "/webhook") -> None:
+    # Subclasses may declare their own __slots__ or fall back to a dict
+    __slots__ = (
+        "bot_token",
+        "webhook_path",
+        "bot",
+        "dp",
+        "app",
+        "_typing_chats",
+        "_typing_master",
+        "_typing_wakeup",
+        "_admin_manager",
+        "per_chat_concurrency",
+        "_chat_queues",
+        "_chat_workers",
+    )
+
+    _commands: ClassVar[Mapping[str, HandlerProtocol]]
+    _command_table: ClassVar[dict[str, tuple[HandlerProtocol, bool, bool]]]
+    _commands_tuple: ClassVar[tuple[str, ...]]
+    _command_descriptions: ClassVar[dict[str, str]]
+    _help_text: ClassVar[str]
+    _bot_commands: ClassVar[list[BotCommand]]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        _discover_handlers(cls)
+
+    def __init__(
+        self,
+        bot_token: str,
+        webhook_path: str = "/webhook",
+        session: AiohttpSession | None = None,
+        per_chat_concurrency: bool = False,
+    ) -> None:
         self.bot_token = bot_token
         self.webhook_path = webhook_path
-        self.bot = Bot(token=bot_token)
+        self.bot = Bot(token=bot_token, session=session)
         self.dp = Dispatcher()
-        self._typing_tasks: dict[int, asyncio.Task[None]] = {}
+        self._typing_chats: set[int] = set()
+        self._typing_master: asyncio.Task[None] | None = None
+        self._typing_wakeup = asyncio.Event()
+        self.per_chat_concurrency = per_chat_concurrency
+        self._chat_queues: dict[int, asyncio.Queue[_QueuedCommand]] = {}
+        self._chat_workers: dict[int, asyncio.Task[None]] = {}
         self._admin_manager = AdminChannelManager(self.bot)
         self._setup_handlers()
 
-        # Only setup webhook if FastAPI is available
-        if _FASTAPI_AVAILABLE:
-            self.app: FastAPI | None = FastAPI()
-            self._setup_webhook()
-        else:
-            self.app = None
+        # Webhook wiring (and the FastAPI import behind it) is deferred
+        # until run_webhook actually needs it
+        self.app: FastAPI | None = None
 
     def _setup_handlers(self) -> None:
         """Set up aiogram handlers for discovered commands."""
-        # Create working copy of commands
-        commands_to_register = dict(self._commands)
-
-        # Add auto-generated help command if not already defined
-        if "help" not in commands_to_register:
-            commands_to_register["help"] = self._auto_help_handler  # type: ignore[assignment]
-
-        for command_name, handler in commands_to_register.items():
-            # Create a wrapper that adapts the handler signature
-            def create_command_handler(
-                cmd_handler: HandlerProtocol,  # [[Any, TypedEvent, str], Awaitable[None]],
-                cmd_name: str,
-            ) -> Callable[[Message], Awaitable[None]]:
-                async def command_wrapper(message: Message) -> None:
-                    # Extract arguments from message text
-                    text = message.text or ""
-                    parts = text.split(" ", 1)
-                    args = parts[1] if len(parts) > 1 else ""
-
-                    # Create typed event wrapper
-                    event = TypedEvent(message)
-
-                    # Check if handler should have typing indicator
-                    if not getattr(cmd_handler, "_no_typing", False):
-                        await self._start_typing(message.chat.id)
-                        try:
-                            await cmd_handler(self, event, args)
-                        finally:
-                            await self._stop_typing(message.chat.id)
-                    else:
-                        await cmd_handler(self, event, args)
-
-                return command_wrapper
-
-            # Register the command handler
-            command_handler = create_command_handler(handler, command_name)
-            self.dp.message.register(command_handler, Command(command_name))
-
-    def _setup_webhook(self) -> None:
-        """Set up FastAPI webhook endpoint."""
-        if not self.app:
+        # One shared dispatcher method; each command binds its resolved
+        # table entry up front, so dispatch does no lookup per message
+        for command_name in self._commands_tuple:
+            self.dp.message.register(
+                partial(self._dispatch, self._command_table[command_name]),
+                Command(command_name),
+            )
+
+    async def _dispatch(
+        self,
+        entry: tuple[HandlerProtocol, bool, bool],
+        message: Message,
+        command: CommandObject,
+    ) -> None:
+        """Dispatch an inbound command message to its handler."""
+        handler, skip_typing, skip_event = entry
+
+        # The Command filter already parsed the arguments
+        args = command.args or ""
+
+        # Create typed event wrapper unless the handler opted out
+        event: TypedEvent | Message = message if skip_event else TypedEvent(message)
+
+        if self.per_chat_concurrency:
+            # Queue per chat: slow handlers block their own chat only, while
+            # in-chat ordering is preserved
+            self._enqueue(message.chat.id, handler, skip_typing, event, args)
             return
 
-        @self.app.post(self.webhook_path)
-        async def webhook_handler(request: Request) -> dict[str, str]:
-            data = await request.json()
-            update = Update.model_validate(data)
-            await self.dp.feed_update(self.bot, update)
-            return {"status": "ok"}
+        await self._run_handler(handler, skip_typing, event, message.chat.id, args)
+
+    async def _run_handler(
+        self,
+        handler: HandlerProtocol,
+        skip_typing: bool,
+        event: TypedEvent | Message,
+        chat_id: int,
+        args: str,
+    ) -> None:
+        """Run one handler, with the typing indicator unless opted out."""
+        if skip_typing:
+            await handler(self, event, args)  # type: ignore[arg-type]
+            return
 
-    async def _sync_commands_with_botfather(self) -> None:
-        """Sync discovered commands with BotFather using Bot API."""
-        # Generate command descriptions from method docstrings
-        bot_commands: list[BotCommand] = []
-        commands_to_sync = dict(self._commands)
+        await self._start_typing(chat_id)
+        try:
+            await handler(self, event, args)  # type: ignore[arg-type]
+        finally:
+            await self._stop_typing(chat_id)
+
+    def _enqueue(
+        self,
+        chat_id: int,
+        handler: HandlerProtocol,
+        skip_typing: bool,
+        event: TypedEvent | Message,
+        args: str,
+    ) -> None:
+        """Queue a command for its chat, starting the chat worker lazily."""
+        queue = self._chat_queues.get(chat_id)
+        if queue is None:
+            queue = asyncio.Queue()
+            self._chat_queues[chat_id] = queue
+            self._spawn_worker(chat_id, queue)
+        queue.put_nowait((handler, skip_typing, event, args))
+
+    def _spawn_worker(self, chat_id: int, queue: asyncio.Queue[_QueuedCommand]) -> None:
+        """Start a worker task for a chat queue and hook up its retirement."""
+        worker = asyncio.create_task(self._chat_worker(chat_id, queue))
+        worker.add_done_callback(partial(self._on_worker_done, chat_id))
+        self._chat_workers[chat_id] = worker
+
+    def _on_worker_done(self, chat_id: int, worker: asyncio.Task[None]) -> None:
+        """Retire a finished chat worker, restarting it if work raced in.
+
+        A handler exception ends the worker task; logging it here and
+        respawning over the surviving queue means one failure neither kills
+        the chat nor drops commands dispatched while the task was dying.
+        """
+        queue = self._chat_queues.pop(chat_id, None)
+        self._chat_workers.pop(chat_id, None)
+        if worker.cancelled():
+            return
+        exc = worker.exception()
+        if exc is not None:
+            logger.error("Handler failed in chat %d: %r", chat_id, exc)
+        if queue is not None and not queue.empty():
+            # Commands landed between the worker stopping and this callback
+            self._chat_queues[chat_id] = queue
+            self._spawn_worker(chat_id, queue)
+
+    async def _chat_worker(
+        self, chat_id: int, queue: asyncio.Queue[_QueuedCommand]
+    ) -> None:
+        """Run queued commands for one chat in order, exiting once it drains.
+
+        Retiring on an empty queue keeps an idle chat from pinning a task
+        and queue forever; the done callback spawns a fresh worker on demand.
+        """
+        while True:
+            try:
+                handler, skip_typing, event, args = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            await self._run_handler(handler, skip_typing, event, chat_id, args)
+            queue.task_done()
+
+    def _ensure_webhook(self) -> None:
+        """Create the FastAPI app and webhook endpoint on first use."""
+        if self.app is not None:
+            return
 
-        # Add help command for sync if not present
-        if "help" not in commands_to_sync:
-            commands_to_sync["help"] = self._auto_help_handler  # type: ignore[assignment]
+        try:
+            from ._webhook import create_webhook_app
+        except ImportError as exc:
+            raise RuntimeError(
+                "FastAPI is not available. Install with: pip install fastapi uvicorn"
+            ) from exc
 
-        # Check if we have any commands to sync after adding help
-        if not commands_to_sync:
-            logger.info("No commands to sync")
-            return
+        self.app = create_webhook_app(self.bot, self.dp, self.webhook_path)
 
-        for cmd_name, method in commands_to_sync.items():
-            # Get description from docstring or use default
-            description = "Command"
-            if hasattr(method, "__doc__") and method.__doc__:
-                # Extract first line of docstring
-                doc_lines = method.__doc__.strip().split("\n")
-                description = doc_lines[0].strip(".")
-                if not description:
-                    description = "Command"
-
-            bot_commands.append(
-                BotCommand(command=cmd_name, description=description[:256])
-            )
+    async def _sync_commands_with_botfather(self) -> None:
+        """Sync discovered commands with BotFather using Bot API."""
+        # The command list was built once at class creation
+        bot_commands = self._bot_commands
+
+        # Skip the round-trip when the command list matches the last sync
+        digest = hashlib.blake2b(
+            json.dumps(
+                [(cmd.command, cmd.description) for cmd in bot_commands],
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+        cache_path = _commands_cache_path(self.bot_token)
+        if cache_path.exists():
+            try:
+                cached = json.loads(cache_path.read_text())
+            except json.JSONDecodeError:
+                cached = {}
+            if cached.get("commands_hash") == digest:
+                logger.info("Bot commands unchanged since last sync, skipping")
+                return
 
         await self.bot.set_my_commands(bot_commands)
-        logger.info(
-            f"Successfully synced {len(bot_commands)} commands with BotFather: {[cmd.command for cmd in bot_commands]}"
-        )
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"commands_hash": digest}))
+        logger.info("Successfully synced %d commands with BotFather", len(bot_commands))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Synced commands: %s", [cmd.command for cmd in bot_commands])
 
     async def start(self) -> None:
         """Start the bot and sync commands."""
@@ -226,21 +465,34 @@ class HandlerBotBase(metaclass=HandlerMeta):
 
     def run_webhook(self, host: str = "0.0.0.0", port: int = 8000) -> None:
         """Run the bot with webhook support."""
-        if not _FASTAPI_AVAILABLE:
-            raise RuntimeError(
-                "FastAPI is not available. Install with: pip install fastapi uvicorn"
-            )
+        self._ensure_webhook()
+        assert self.app is not None
 
-        if not self.app:
-            raise RuntimeError("Webhook not initialized")
+        import uvicorn  # Deferred along with the rest of the webhook stack
 
         # Register startup event handler
         @self.app.on_event("startup")
         async def startup_event() -> None:
             await self.start()
 
-        # Start FastAPI server
-        uvicorn.run(self.app, host=host, port=port)
+        # Start FastAPI server on the C-accelerated loop and HTTP parser
+        uvicorn.run(
+            self.app,
+            host=host,
+            port=port,
+            loop="uvloop" if _UVLOOP_AVAILABLE else "auto",
+            http="httptools" if _HTTPTOOLS_AVAILABLE else "auto",
+        )
+
+    @classmethod
+    async def run_many(cls, bots: Sequence[HandlerBotBase]) -> None:
+        """Run several bots concurrently with polling.
+
+        Startup calls and the polling loops are gathered so one bot's
+        network round-trips never delay the others.
+        """
+        await asyncio.gather(*(bot.start() for bot in bots))
+        await asyncio.gather(*(bot.dp.start_polling(bot.bot) for bot in bots))
 
     async def run_polling(self) -> None:
         """Run the bot with polling."""
@@ -255,47 +507,70 @@ class HandlerBotBase(metaclass=HandlerMeta):
     async def _shutdown(self) -> None:
         """Handle bot shutdown."""
         logger.info("🛑 Bot shutting down...")
+        workers = list(self._chat_workers.values())
+        for worker in workers:
+            worker.cancel()
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
         logger.info("✅ Shutdown complete")
 
     async def _auto_help_handler(self, event: TypedEvent, args: str) -> None:
         """Auto-generated help command that lists all available commands and their descriptions."""
-        help_lines = ["Available commands:"]
-
-        for cmd_name, handler in sorted(self._commands.items()):
-            # Get description from docstring or use default
-            description = "Command"
-            if hasattr(handler, "__doc__") and handler.__doc__:
-                # Extract first line of docstring
-                doc_lines = handler.__doc__.strip().split("\n")
-                description = doc_lines[0].strip(".")
-                if not description:
-                    description = "Command"
-
-            help_lines.append(f"/{cmd_name} - {description}")
-
-        await event.reply("\n".join(help_lines))
+        await event.reply(self._help_text)
 
     async def _start_typing(self, chat_id: int) -> None:
         """Start continuous typing indicator for a chat."""
-        if chat_id in self._typing_tasks:
-            return  # Already typing
-
-        async def typing_loop() -> None:
-            try:
-                while True:
-                    await self.bot(
-                        send_chat_action.SendChatAction(
-                            chat_id=chat_id, action="typing"
+        self._typing_chats.add(chat_id)
+        # Wake a sleeping loop so the chat's first action goes out now
+        # instead of after the remainder of the 4s batch interval
+        self._typing_wakeup.set()
+        if self._typing_master is None or self._typing_master.done():
+            self._typing_master = asyncio.create_task(self._typing_loop())
+
+    async def _typing_loop(self) -> None:
+        """Send typing actions for all active chats from one shared task.
+
+        One master task batches the sends for every active chat instead of
+        spawning a staggered task per chat; it exits once no chat is typing.
+        """
+        try:
+            while self._typing_chats:
+                self._typing_wakeup.clear()
+                chat_ids = list(self._typing_chats)
+                results = await asyncio.gather(
+                    *(
+                        self.bot(
+                            send_chat_action.SendChatAction(
+                                chat_id=chat_id, action="typing"
+                            )
                         )
-                    )
-                    await asyncio.sleep(4)  # Send typing action every 4 seconds
-            except asyncio.CancelledError:
-                pass  # Task was cancelled, stop typing
-
-        self._typing_tasks[chat_id] = asyncio.create_task(typing_loop())
+                        for chat_id in chat_ids
+                    ),
+                    return_exceptions=True,
+                )
+                # One failed send (blocked bot, gone chat, ...) must not end
+                # typing for every other chat; drop the offender and move on
+                for chat_id, result in zip(chat_ids, results):
+                    if isinstance(result, BaseException):
+                        self._typing_chats.discard(chat_id)
+                        logger.debug(
+                            "Typing indicator failed for chat %d: %r",
+                            chat_id,
+                            result,
+                        )
+                # Refresh every 4 seconds, or immediately when a new chat
+                # becomes active and needs its first action
+                try:
+                    await asyncio.wait_for(self._typing_wakeup.wait(), timeout=4)
+                except TimeoutError:
+                    pass
+        except asyncio.CancelledError:
+            pass  # Task was cancelled, stop typing
 
     async def _stop_typing(self, chat_id: int) -> None:
         """Stop typing indicator for a chat."""
-        if chat_id in self._typing_tasks:
-            self._typing_tasks[chat_id].cancel()
-            del self._typing_tasks[chat_id]
+        self._typing_chats.discard(chat_id)
+
+
+# __init_subclass__ only fires for subclasses; seed the base class maps here
+_discover_handlers(HandlerBotBase)
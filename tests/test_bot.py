@@ -1,13 +1,16 @@
 """Tests for the minimal bot framework with type safety."""
 
+import asyncio
 import os
+import sys
+from pathlib import Path
 from typing import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
 
-from telegentic import EchoArgs, HandlerBotBase, NoArgs, TypedEvent
+from telegentic import EchoArgs, HandlerBotBase, NoArgs, TypedEvent, no_typing
 
 TEST_TOKEN = os.getenv("TELEGENTIC_TEST_TOKEN", "test_token")
 
@@ -56,8 +59,8 @@ class TestBot(HandlerBotBase):
         await event.reply("Pong!")
 
 
-class TestHandlerMeta:
-    """Test the handler metaclass."""
+class TestHandlerDiscovery:
+    """Test the handler discovery hook."""
 
     def test_snake_case_handler_discovery(self) -> None:
         """Test that snake_case handlers are discovered correctly."""
@@ -113,9 +116,14 @@ class TestHandlerBotBase:
 
     @pytest.mark.asyncio
     async def test_sync_commands_with_botfather(
-        self, mock_bot: MagicMock, mock_dispatcher: MagicMock
+        self,
+        mock_bot: MagicMock,
+        mock_dispatcher: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test command synchronization with BotFather."""
+        monkeypatch.setenv("TELEGENTIC_CACHE_DIR", str(tmp_path))
         bot = TestBot(TEST_TOKEN)
 
         await bot._sync_commands_with_botfather()
@@ -131,9 +139,14 @@ class TestHandlerBotBase:
 
     @pytest.mark.asyncio
     async def test_empty_commands_sync(
-        self, mock_bot: MagicMock, mock_dispatcher: MagicMock
+        self,
+        mock_bot: MagicMock,
+        mock_dispatcher: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test sync with auto-generated help command."""
+        monkeypatch.setenv("TELEGENTIC_CACHE_DIR", str(tmp_path))
 
         class EmptyBot(HandlerBotBase):
             pass
@@ -149,16 +162,55 @@ class TestHandlerBotBase:
         command_names = [cmd.command for cmd in call_args]
         assert command_names == ["help"]
 
+    @pytest.mark.asyncio
+    async def test_run_many_starts_all_bots(
+        self,
+        mock_bot: MagicMock,
+        mock_dispatcher: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that run_many starts and polls every bot."""
+        monkeypatch.setenv("TELEGENTIC_CACHE_DIR", str(tmp_path))
+        bots = [TestBot(TEST_TOKEN), TestBot(TEST_TOKEN)]
+        for bot in bots:
+            bot.start = AsyncMock()  # type: ignore[method-assign]
+
+        await HandlerBotBase.run_many(bots)
+
+        for bot in bots:
+            bot.start.assert_awaited_once()  # type: ignore[attr-defined]
+        assert mock_dispatcher.start_polling.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_sync_skipped_when_commands_unchanged(
+        self,
+        mock_bot: MagicMock,
+        mock_dispatcher: MagicMock,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that an unchanged command list skips the BotFather call."""
+        monkeypatch.setenv("TELEGENTIC_CACHE_DIR", str(tmp_path))
+        bot = TestBot(TEST_TOKEN)
+
+        await bot._sync_commands_with_botfather()
+        await bot._sync_commands_with_botfather()
+
+        # Second sync finds the cached hash and skips the round-trip
+        mock_bot.set_my_commands.assert_called_once()
+
     def test_fastapi_app_creation(
         self, mock_bot: MagicMock, mock_dispatcher: MagicMock
     ) -> None:
-        """Test FastAPI app creation when available."""
+        """Test that the FastAPI app is created lazily on first use."""
         bot = TestBot(TEST_TOKEN)
 
-        try:
-            assert bot.app is not None
-        except ImportError:
-            assert bot.app is None
+        # No webhook wiring (or FastAPI import) happens at construction time
+        assert bot.app is None
+
+        bot._ensure_webhook()
+        assert bot.app is not None
 
     def test_webhook_not_available_error(
         self, mock_bot: MagicMock, mock_dispatcher: MagicMock
@@ -166,11 +218,10 @@ class TestHandlerBotBase:
         """Test error when trying to use webhook without FastAPI."""
         bot = TestBot(TEST_TOKEN)
 
-        # Mock FastAPI as not available
-        bot.app = None
-
-        with pytest.raises(RuntimeError, match="Webhook not initialized"):
-            bot.run_webhook()
+        # Simulate FastAPI not being installed
+        with patch.dict(sys.modules, {"telegentic._webhook": None}):
+            with pytest.raises(RuntimeError, match="FastAPI is not available"):
+                bot.run_webhook()
 
 
 @pytest.mark.asyncio
@@ -217,6 +268,43 @@ class TestEventHandling:
         await bot.handle_echo(event, "")
         message.reply.assert_called_with("No args provided")
 
+    async def test_chat_worker_survives_handler_failure(
+        self, mock_bot: MagicMock, mock_dispatcher: MagicMock
+    ) -> None:
+        """Test that one failing handler doesn't kill later commands for its chat."""
+        ran: list[str] = []
+
+        class QueueBot(HandlerBotBase):
+            @no_typing
+            async def handle_boom(self, event: TypedEvent, args: str) -> None:
+                """Always raises."""
+                raise ValueError("boom")
+
+            @no_typing
+            async def handle_note(self, event: TypedEvent, args: str) -> None:
+                """Records its arguments."""
+                ran.append(args)
+
+        bot = QueueBot(TEST_TOKEN, per_chat_concurrency=True)
+        message = MagicMock()
+        message.chat.id = 42
+
+        command = MagicMock()
+        command.args = None
+        await bot._dispatch(bot._command_table["boom"], message, command)
+        command = MagicMock()
+        command.args = "after the failure"
+        await bot._dispatch(bot._command_table["note"], message, command)
+
+        # Let the worker crash, restart over the surviving queue and drain it
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+        assert ran == ["after the failure"]
+        # Once drained, the queue and worker are retired again
+        assert bot._chat_queues == {}
+        assert bot._chat_workers == {}
+
 
 class TestTypedEvent:
     """Test the TypedEvent wrapper."""